@@ -5,13 +5,11 @@ import json
 import os
 from typing import Optional
 
-import joblib
-import pandas as pd
 from dotenv import load_dotenv  # type: ignore
 
-from .data import load_data
-from .model import evaluate_and_save, train
-from .paranoid_model.publisher_llm import enrich_signal, write_enriched_report
+# pandas/sklearn/joblib and the enrichment stack are imported inside the
+# command branches below, so parsing (and --help) stays free of their
+# multi-hundred-millisecond import cost.
 
 
 def main(argv: Optional[list[str]] = None) -> None:
@@ -43,6 +41,9 @@ def main(argv: Optional[list[str]] = None) -> None:
     args = parser.parse_args(argv)
 
     if args.command == "train":
+        from .data import load_data
+        from .model import evaluate_and_save, train
+
         data = load_data(args.csv)
         pipeline, metrics = train(
             data,
@@ -69,9 +70,14 @@ def main(argv: Optional[list[str]] = None) -> None:
         )
 
     elif args.command == "predict":
+        import joblib
+        import pandas as pd
+
+        from .model import _predict_inputs
+
         model = joblib.load(args.model_path)
         df = pd.read_csv(args.csv)
-        X = df[["EMF", "Income", "Urbanization"]]
+        X = _predict_inputs(model, df[["EMF", "Income", "Urbanization"]])
         preds = model.predict(X)
         out_json = {"predictions": list(map(float, preds))}
         print(json.dumps(out_json, indent=2))
@@ -81,6 +87,8 @@ def main(argv: Optional[list[str]] = None) -> None:
             pd.DataFrame({"prediction": preds}).to_csv(args.out, index=False)
 
     elif args.command == "enrich":
+        from .paranoid_model.publisher_llm import enrich_signal, write_enriched_report
+
         with open(args.signal, "r", encoding="utf-8") as f:
             raw_signal = json.load(f)
         with open(args.schema, "r", encoding="utf-8") as f:
@@ -1,18 +1,27 @@
 from __future__ import annotations
 
 import os
-from typing import List
+from typing import Dict, List, Optional
 
 import pandas as pd
 
 REQUIRED_COLUMNS: List[str] = ["EMF", "Income", "Urbanization", "TFR"]
 
 
-def load_data(csv_path: str) -> pd.DataFrame:
-    """Load dataset from CSV and validate required columns.
+def load_data(
+    path: str,
+    *,
+    dtype: Optional[Dict[str, object]] = None,
+    usecols: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """Load dataset from CSV or Parquet and validate required columns.
 
     Args:
-        csv_path: Path to CSV file containing training data.
+        path: Path to the training data; ``.parquet`` files are read typed
+            via ``pd.read_parquet``, anything else via ``pd.read_csv``.
+        dtype: Optional column-dtype hints forwarded to ``pd.read_csv`` so the
+            C parser skips type inference (ignored for Parquet, which is typed).
+        usecols: Optional column subset forwarded to the reader.
 
     Returns:
         A pandas DataFrame with validated schema.
@@ -21,10 +30,13 @@ def load_data(csv_path: str) -> pd.DataFrame:
         FileNotFoundError: If the file does not exist.
         ValueError: If required columns are missing or target has NaNs.
     """
-    if not os.path.exists(csv_path):
-        raise FileNotFoundError(f"File not found: {csv_path}")
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"File not found: {path}")
 
-    data = pd.read_csv(csv_path)
+    if path.endswith(".parquet"):
+        data = pd.read_parquet(path, columns=usecols)
+    else:
+        data = pd.read_csv(path, dtype=dtype, usecols=usecols)
 
     missing = [c for c in REQUIRED_COLUMNS if c not in data.columns]
     if missing:
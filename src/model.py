@@ -10,13 +10,26 @@ import numpy as np
 import pandas as pd
 from matplotlib import pyplot as plt
 from sklearn.compose import ColumnTransformer
-from sklearn.ensemble import RandomForestRegressor
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.inspection import permutation_importance
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_squared_error, r2_score
-from sklearn.model_selection import KFold, cross_val_score, train_test_split
+from sklearn.model_selection import KFold, cross_validate, train_test_split
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 
+try:  # optional: compact ONNX artifact for fast load + ONNX Runtime inference
+    from skl2onnx import convert_sklearn  # type: ignore
+    from skl2onnx.common.data_types import FloatTensorType  # type: ignore
+except Exception:  # pragma: no cover
+    convert_sklearn = None
+    FloatTensorType = None
+
+try:  # optional: compiled inference kernels for the exported ONNX artifact
+    import onnxruntime  # type: ignore
+except Exception:  # pragma: no cover
+    onnxruntime = None
+
 RANDOM_STATE: int = 42
 FEATURES = ["EMF", "Income", "Urbanization"]
 TARGET = "TFR"
@@ -29,6 +42,7 @@ class TrainResult:
     feature_plot_path: Optional[str]
     rmse: float
     r2: float
+    onnx_path: Optional[str] = None
 
 
 def build_model(
@@ -44,31 +58,40 @@ def build_model(
         reg = LinearRegression()
         return Pipeline([("pre", pre), ("reg", reg)])
     else:
-        reg = RandomForestRegressor(
-            n_estimators=n_estimators,
+        # Histogram-based boosting trains far faster than a random forest at
+        # comparable accuracy on small tabular data, with a smaller artifact.
+        reg = HistGradientBoostingRegressor(
+            max_iter=n_estimators,
             max_depth=max_depth,
             random_state=RANDOM_STATE,
-            n_jobs=-1,
         )
         return Pipeline([("reg", reg)])
 
 
-def _holdout_metrics(pipeline: Pipeline, X_val: pd.DataFrame, y_val: pd.Series) -> Dict[str, float]:
+def _holdout_metrics(
+    pipeline: Pipeline, X_val: pd.DataFrame | np.ndarray, y_val: pd.Series | np.ndarray
+) -> Dict[str, float]:
     preds = pipeline.predict(X_val)
     rmse = float(np.sqrt(mean_squared_error(y_val, preds)))
     r2 = float(r2_score(y_val, preds))
     return {"rmse": rmse, "r2": r2}
 
 
-def _cv_metrics(pipeline: Pipeline, X: pd.DataFrame, y: pd.Series, cv: int) -> Dict[str, float]:
+def _cv_metrics(
+    pipeline: Pipeline, X: pd.DataFrame | np.ndarray, y: pd.Series | np.ndarray, cv: int
+) -> Dict[str, float]:
     kf = KFold(n_splits=cv, shuffle=True, random_state=RANDOM_STATE)
-    neg_rmse = cross_val_score(
-        pipeline, X, y, scoring="neg_root_mean_squared_error", cv=kf, n_jobs=-1
+    scores = cross_validate(
+        pipeline,
+        X,
+        y,
+        scoring={"rmse": "neg_root_mean_squared_error", "r2": "r2"},
+        cv=kf,
+        n_jobs=-1,
     )
-    r2_scores = cross_val_score(pipeline, X, y, scoring="r2", cv=kf, n_jobs=-1)
     return {
-        "rmse": float(-neg_rmse.mean()),
-        "r2": float(r2_scores.mean()),
+        "rmse": float(-scores["test_rmse"].mean()),
+        "r2": float(scores["test_r2"].mean()),
         "cv": cv,
     }
 
@@ -84,9 +107,18 @@ def train(
     X = data[FEATURES]
     y = data[TARGET]
 
+    if model_type != "linear":
+        # Tree models do not need column names or scaling; hand sklearn one
+        # contiguous float32 array up front instead of letting every fit
+        # (and every CV fold) redo the pandas->float64 conversion.
+        X = np.ascontiguousarray(X.to_numpy(dtype=np.float32))
+        y = y.to_numpy(dtype=np.float32)
+
     pipeline = build_model(model_type=model_type, n_estimators=n_estimators, max_depth=max_depth)
 
     if cv and cv >= 2:
+        # Never ask for more folds than the data can fill with >=2 rows each
+        cv = max(2, min(cv, len(X) // 2))
         metrics = _cv_metrics(pipeline, X, y, cv=cv)
         pipeline.fit(X, y)
         metrics["mode"] = f"cv-{cv}"
@@ -102,6 +134,54 @@ def train(
     return pipeline, metrics
 
 
+def _predict_inputs(
+    pipeline: Pipeline, X: pd.DataFrame | np.ndarray
+) -> pd.DataFrame | np.ndarray:
+    """Match train()'s input layout at predict time.
+
+    Tree pipelines are fitted on an unnamed contiguous float32 array, so a
+    named DataFrame must be stripped to the same layout here or sklearn
+    warns about mismatched feature names on every predict.
+    """
+    if isinstance(X, pd.DataFrame) and "pre" not in pipeline.named_steps:
+        return np.ascontiguousarray(X.to_numpy(dtype=np.float32))
+    return X
+
+
+# Keyed by (path, mtime) so rewriting the artifact (e.g. a retrain in the
+# same process) invalidates the previously loaded session.
+_ONNX_SESSIONS: Dict[Tuple[str, float], "onnxruntime.InferenceSession"] = {}
+
+
+def fast_predict(
+    pipeline: Pipeline,
+    X: pd.DataFrame | np.ndarray,
+    onnx_path: str = "./artifacts/model.onnx",
+) -> np.ndarray:
+    """Batch predict via the exported ONNX artifact when ONNX Runtime is
+    available, falling back to the sklearn pipeline otherwise.
+
+    The ONNX Runtime session is cached per artifact path and mtime so
+    repeated calls skip model load and run the compiled tree kernels
+    directly, while a rewritten artifact is picked up fresh.
+    """
+    if onnxruntime is not None and os.path.exists(onnx_path):
+        key = (onnx_path, os.path.getmtime(onnx_path))
+        sess = _ONNX_SESSIONS.get(key)
+        if sess is None:
+            # Drop sessions for stale versions of this artifact before caching
+            for old in [k for k in _ONNX_SESSIONS if k[0] == onnx_path]:
+                del _ONNX_SESSIONS[old]
+            sess = onnxruntime.InferenceSession(onnx_path)
+            _ONNX_SESSIONS[key] = sess
+        arr = np.ascontiguousarray(
+            X.to_numpy(dtype=np.float32) if isinstance(X, pd.DataFrame) else X,
+            dtype=np.float32,
+        )
+        return sess.run(None, {"X": arr})[0].ravel()
+    return np.asarray(pipeline.predict(_predict_inputs(pipeline, X)))
+
+
 def _ensure_dir(path: str) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
 
@@ -122,10 +202,32 @@ def evaluate_and_save(
     with open(metrics_path, "w", encoding="utf-8") as f:
         json.dump(metrics, f, indent=2)
 
+    onnx_path = None
+    if convert_sklearn is not None:
+        try:
+            onx = convert_sklearn(
+                pipeline,
+                initial_types=[("X", FloatTensorType([None, len(FEATURES)]))],
+            )
+            onnx_path = os.path.splitext(model_path)[0] + ".onnx"
+            with open(onnx_path, "wb") as f:
+                f.write(onx.SerializeToString())
+        except Exception:  # conversion is best-effort; joblib remains canonical
+            onnx_path = None
+
     feature_plot = None
     reg = pipeline.named_steps.get("reg")
-    if hasattr(reg, "feature_importances_"):
-        importances = reg.feature_importances_
+    importances = getattr(reg, "feature_importances_", None)
+    if importances is None and isinstance(reg, HistGradientBoostingRegressor):
+        # HistGradientBoostingRegressor exposes no impurity importances;
+        # recover the plot with permutation importance on the training data
+        # (same unnamed float32 layout the model was fitted on).
+        X = np.ascontiguousarray(data[FEATURES].to_numpy(dtype=np.float32))
+        y = data[TARGET].to_numpy(dtype=np.float32)
+        importances = permutation_importance(
+            pipeline, X, y, n_repeats=5, random_state=RANDOM_STATE, n_jobs=-1
+        ).importances_mean
+    if importances is not None:
         labels = FEATURES
         fig, ax = plt.subplots(figsize=(6, 4))
         ax.bar(labels, importances)
@@ -142,4 +244,5 @@ def evaluate_and_save(
         feature_plot_path=feature_plot,
         rmse=float(metrics["rmse"]),
         r2=float(metrics["r2"]),
+        onnx_path=onnx_path,
     )
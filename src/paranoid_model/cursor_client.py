@@ -9,6 +9,14 @@ DEFAULT_MODEL = os.getenv("CURSOR_MODEL", "gpt-5")
 API_BASE = os.getenv("CURSOR_API_BASE", "https://api.cursor.sh/v1")
 API_KEY = os.getenv("CURSOR_API_KEY")
 
+# Shared session so repeated calls reuse pooled keep-alive connections
+# instead of paying a fresh TCP+TLS handshake per request.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0),
+)
+
 
 class CursorError(RuntimeError): ...
 
@@ -55,7 +63,7 @@ def call_cursor_gpt5(
     while True:
         attempt += 1
         try:
-            resp = requests.post(url, headers=headers, json=payload, timeout=timeout)
+            resp = _SESSION.post(url, headers=headers, json=payload, timeout=timeout)
             if resp.status_code >= 400:
                 raise CursorError(f"HTTP {resp.status_code}: {resp.text[:400]}")
             data = resp.json()
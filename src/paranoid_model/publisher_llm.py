@@ -1,13 +1,38 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import hashlib
 import json
 import os
+import random
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional
 
+import requests
+
+from .cursor_client import CursorError
 from .cursor_client import call_cursor_gpt5 as cursor_call
 
+try:  # optional: schema-specialized validators, ~10x faster than jsonschema
+    import fastjsonschema  # type: ignore
+except Exception:  # pragma: no cover
+    fastjsonschema = None
+
+try:  # optional: C-implemented JSON serialization for report writes
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
+
+try:
+    import jsonschema  # type: ignore
+except Exception:  # pragma: no cover
+    jsonschema = None
+
 
 @dataclass
 class CursorGpt5Config:
@@ -16,91 +41,160 @@ class CursorGpt5Config:
     max_tokens: int = 2200
     seed: int = 42
     retries: int = 2
-    backoff_seconds: tuple[float, float] = (2.0, 5.0)
+    max_backoff: float = 32.0
 
 
 # Transport is provided by cursor_client.call_cursor_gpt5
 
+# Compiled validator callables keyed by schema identity; the schema itself is
+# kept in the value so its id() cannot be recycled while the entry is live.
+_VALIDATOR_CACHE: Dict[int, tuple] = {}
+
+
+def _compile_validator(schema: Dict[str, Any]):
+    if fastjsonschema is not None:
+        return fastjsonschema.compile(schema)
+    if jsonschema is None:  # pragma: no cover
+        raise RuntimeError("jsonschema package is required for validation")
+
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema).validate
+
 
 def validate_against_schema(obj: Dict[str, Any], schema: Dict[str, Any]) -> None:
-    try:
-        import jsonschema  # type: ignore
-    except Exception as exc:  # pragma: no cover
-        raise RuntimeError("jsonschema package is required for validation") from exc
+    cached = _VALIDATOR_CACHE.get(id(schema))
+    if cached is None:
+        cached = (schema, _compile_validator(schema))
+        _VALIDATOR_CACHE[id(schema)] = cached
+    cached[1](obj)
 
-    jsonschema.validate(instance=obj, schema=schema)
 
+_DEFAULT_PALETTE = frozenset(("#0A2342", "#FF7A00", "#F2F4F7", "#1A1F2B"))
+
+
+@lru_cache(maxsize=8)
+def _disallowed_hex_re(allowed: frozenset) -> "re.Pattern[str]":
+    # Matches any hex color NOT in the allowed palette, so one linear scan
+    # with short-circuit on the first violation replaces findall + set diff.
+    alternation = "|".join(sorted(color.lstrip("#") for color in allowed))
+    return re.compile(rf"#(?!(?:{alternation}))[0-9a-fA-F]{{6}}")
 
-def sanitize_svg(svg_text: str, allowed_palette: list[str]) -> str:
-    # Minimal palette enforcement: ensure only allowed hex colors are present
-    import re
 
-    hex_colors = set(re.findall(r"#[0-9a-fA-F]{6}", svg_text))
-    disallowed = [c for c in hex_colors if c not in set(allowed_palette)]
-    if disallowed:
-        raise ValueError(f"SVG contains disallowed colors: {sorted(disallowed)}")
+def sanitize_svg(svg_text: str, allowed_palette: frozenset[str] | list[str]) -> str:
+    # Minimal palette enforcement: ensure only allowed hex colors are present
+    if "#" not in svg_text:  # no hex colors at all; skip the regex scan
+        return svg_text
+    allowed = (
+        allowed_palette
+        if isinstance(allowed_palette, frozenset)
+        else frozenset(allowed_palette)
+    )
+    match = _disallowed_hex_re(allowed).search(svg_text)
+    if match:
+        raise ValueError(f"SVG contains disallowed color: {match.group(0)}")
     return svg_text
 
 
+# Prompt boilerplate is static; assemble it once at import so per-signal work
+# is a single f-string splice of the signal JSON.
+_SYSTEM_PROMPT = (
+    'You are a careful news synthesizer for "Paranoid Newswire". '
+    "Your job is to turn model signals into clear, truthful, minimally "
+    "sensational news briefs for non-experts. "
+    "Be precise, avoid hype, quantify impacts, cite sources, and output "
+    "STRICT JSON that passes the provided JSON Schema. "
+    "Include a minimal symbolist SVG illustration that matches the signal "
+    "category, using only the allowed palette and simple shapes."
+)
+
+_USER_PROMPT_HEAD = "\n".join(
+    [
+        "TASK:",
+        (
+            "Turn the following paranoid-model signal into a reader-"
+            "friendly news brief card and a matching minimal symbolist SVG."
+        ),
+        "",
+        "AUDIENCE:",
+        "Smart readers without stats background. Keep it concise and explanatory.",
+        "",
+        "TONE:",
+        (
+            "Sober, confident, FT-style with a subtle facelift. No hype. "
+            "Numbers over adjectives."
+        ),
+        "",
+        "BRAND PALETTE:",
+        "- Dark Blue: #0A2342",
+        "- Accent Orange: #FF7A00",
+        "- Paper: #F2F4F7",
+        "- Anchor: #1A1F2B",
+        "",
+        "LAYOUT HINTS:",
+        "- kicker, title, lede, why_it_matters (bullets), confidence, fact_checks",
+        "- symbolic_art: SVG (viewBox 0 0 320 180), palette only, alt text",
+        "- visual_tag, cta (label,url)",
+        "",
+        "CATEGORY→ICON GUIDE:",
+        (
+            "geopolitics: compass / routes; economy: candles+line; bio_health: "
+            "cell nucleus; climate_energy: sun/wind/leaf; cyber_tech: "
+            "circuit/lock; socio_culture: bubbles; supply_chain: containers+arrow; "
+            "ai_research: lambda/neurons"
+        ),
+        "",
+        "INPUT SIGNAL (verbatim JSON):",
+    ]
+)
+
+_USER_PROMPT_TAIL = "\n".join(
+    [
+        "",
+        "",
+        "OUTPUT:",
+        (
+            "Return a SINGLE JSON object that conforms to FEED_ITEM_SCHEMA "
+            "plus the extra fields described. Do not include explanations."
+        ),
+    ]
+)
+
+
 def build_system_prompt() -> str:
-    return (
-        'You are a careful news synthesizer for "Paranoid Newswire". '
-        "Your job is to turn model signals into clear, truthful, minimally "
-        "sensational news briefs for non-experts. "
-        "Be precise, avoid hype, quantify impacts, cite sources, and output "
-        "STRICT JSON that passes the provided JSON Schema. "
-        "Include a minimal symbolist SVG illustration that matches the signal "
-        "category, using only the allowed palette and simple shapes."
-    )
+    return _SYSTEM_PROMPT
 
 
 def build_user_prompt(raw_signal_json: str) -> str:
-    return "\n".join(
-        [
-            "TASK:",
-            (
-                "Turn the following paranoid-model signal into a reader-"
-                "friendly news brief card and a matching minimal symbolist SVG."
-            ),
-            "",
-            "AUDIENCE:",
-            "Smart readers without stats background. Keep it concise and explanatory.",
-            "",
-            "TONE:",
-            (
-                "Sober, confident, FT-style with a subtle facelift. No hype. "
-                "Numbers over adjectives."
-            ),
-            "",
-            "BRAND PALETTE:",
-            "- Dark Blue: #0A2342",
-            "- Accent Orange: #FF7A00",
-            "- Paper: #F2F4F7",
-            "- Anchor: #1A1F2B",
-            "",
-            "LAYOUT HINTS:",
-            "- kicker, title, lede, why_it_matters (bullets), confidence, fact_checks",
-            "- symbolic_art: SVG (viewBox 0 0 320 180), palette only, alt text",
-            "- visual_tag, cta (label,url)",
-            "",
-            "CATEGORY→ICON GUIDE:",
-            (
-                "geopolitics: compass / routes; economy: candles+line; bio_health: "
-                "cell nucleus; climate_energy: sun/wind/leaf; cyber_tech: "
-                "circuit/lock; socio_culture: bubbles; supply_chain: containers+arrow; "
-                "ai_research: lambda/neurons"
-            ),
-            "",
-            "INPUT SIGNAL (verbatim JSON):",
-            raw_signal_json,
-            "",
-            "OUTPUT:",
-            (
-                "Return a SINGLE JSON object that conforms to FEED_ITEM_SCHEMA "
-                "plus the extra fields described. Do not include explanations."
-            ),
-        ]
+    return f"{_USER_PROMPT_HEAD}\n{raw_signal_json}{_USER_PROMPT_TAIL}"
+
+
+# Validated responses keyed by (model, prompts, sampling params) so repeated
+# signals — retries, regenerations, test runs — skip the LLM round-trip.
+# Hits are deep-copied on the way out so callers can mutate their card
+# without corrupting later lookups; size is capped for long-running batches.
+_RESPONSE_CACHE: Dict[str, Dict[str, Any]] = {}
+_RESPONSE_CACHE_MAX = 1024
+
+
+def _response_cache_key(
+    system: str, user: str, cfg: CursorGpt5Config, schema: Dict[str, Any]
+) -> str:
+    payload = json.dumps(
+        {
+            "model": "gpt-5",
+            "sys": system,
+            "user": user,
+            "t": cfg.temperature,
+            "p": cfg.top_p,
+            "seed": cfg.seed,
+            # Cached entries were validated against a specific schema; a
+            # different schema must miss and re-validate.
+            "schema": schema,
+        },
+        sort_keys=True,
     )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
 
 
 def enrich_signal(raw_signal: Dict[str, Any], schema: Dict[str, Any]) -> Dict[str, Any]:
@@ -108,6 +202,11 @@ def enrich_signal(raw_signal: Dict[str, Any], schema: Dict[str, Any]) -> Dict[st
     system_prompt = build_system_prompt()
     user_prompt = build_user_prompt(json.dumps(raw_signal, ensure_ascii=False))
 
+    cache_key = _response_cache_key(system_prompt, user_prompt, cfg, schema)
+    cached = _RESPONSE_CACHE.get(cache_key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
     for attempt in range(cfg.retries + 1):
         try:
             result = cursor_call(
@@ -120,27 +219,150 @@ def enrich_signal(raw_signal: Dict[str, Any], schema: Dict[str, Any]) -> Dict[st
                 seed=cfg.seed,
                 retries=cfg.retries,
             )
-            validate_against_schema(result, schema)
-            # Palette guard for SVG
-            allowed = ["#0A2342", "#FF7A00", "#F2F4F7", "#1A1F2B"]
-            if "symbolic_art" in result and isinstance(result["symbolic_art"], dict):
-                svg = result["symbolic_art"].get("svg", "")
-                if svg:
-                    sanitize_svg(svg, allowed)
+            result = _guard_result(result, schema)
+            if attempt == 0:
+                # Only first-attempt responses are cached; corrected variants
+                # produced by the retry note answer an altered prompt. Store a
+                # copy so the first caller's mutations cannot reach the cache.
+                if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAX:
+                    # FIFO eviction: dicts iterate in insertion order
+                    del _RESPONSE_CACHE[next(iter(_RESPONSE_CACHE))]
+                _RESPONSE_CACHE[cache_key] = copy.deepcopy(result)
             return result
-        except Exception:  # schema or palette failure
+        except (CursorError, requests.RequestException):  # transport failure
             if attempt < cfg.retries:
-                time.sleep(cfg.backoff_seconds[min(attempt, len(cfg.backoff_seconds) - 1)])
-                # Ask model to fix only schema violations next
-                user_prompt = user_prompt + (
-                    "\n\nNote: return the SAME object, fix only schema violations."
-                )
+                # Exponential backoff with jitter so herds of failing items
+                # don't retry in lockstep against a struggling endpoint.
+                time.sleep(min(cfg.max_backoff, 2.0**attempt) * random.uniform(0.5, 1.5))
                 continue
             raise
+        except Exception:  # schema or palette failure — retry immediately
+            if attempt < cfg.retries:
+                # Ask model to fix only schema violations next (appended once;
+                # repeating it only re-copies the prompt and bills more tokens)
+                if not user_prompt.endswith(_RETRY_NOTE):
+                    user_prompt += _RETRY_NOTE
+                continue
+            raise
+
+
+_RETRY_NOTE = "\n\nNote: return the SAME object, fix only schema violations."
+
+_BATCH_NOTE = (
+    "\n\nNote: the INPUT SIGNAL above is an object {\"items\": [...]} holding "
+    "SEVERAL signals. Return {\"items\": [...]} with one conforming card per "
+    "input signal, in the same order."
+)
+
+
+def _guard_result(result: Dict[str, Any], schema: Dict[str, Any]) -> Dict[str, Any]:
+    validate_against_schema(result, schema)
+    if "symbolic_art" in result and isinstance(result["symbolic_art"], dict):
+        svg = result["symbolic_art"].get("svg", "")
+        if svg:
+            sanitize_svg(svg, _DEFAULT_PALETTE)
+    return result
+
+
+def enrich_signals_batch(
+    signals: list[Dict[str, Any]], schema: Dict[str, Any], batch_size: int = 8
+) -> list[Dict[str, Any]]:
+    """Enrich several signals per LLM call by marshaling them into one prompt.
+
+    Packs up to ``batch_size`` signals into a single request and expects an
+    ``{"items": [...]}`` object back, amortizing the network round-trip and
+    prompt prefill across the batch. Each returned card is validated
+    individually; a batch whose response cannot be used falls back to the
+    per-signal ``enrich_signal`` path.
+    """
+    cfg = CursorGpt5Config()
+    enriched: list[Dict[str, Any]] = []
+    for start in range(0, len(signals), batch_size):
+        chunk = signals[start : start + batch_size]
+        user_prompt = build_user_prompt(json.dumps({"items": chunk}, ensure_ascii=False))
+        try:
+            result = cursor_call(
+                system=build_system_prompt(),
+                user=user_prompt + _BATCH_NOTE,
+                model="gpt-5",
+                temperature=cfg.temperature,
+                top_p=cfg.top_p,
+                max_tokens=cfg.max_tokens * len(chunk),
+                seed=cfg.seed,
+                retries=cfg.retries,
+            )
+            items = result.get("items")
+            if not isinstance(items, list) or len(items) != len(chunk):
+                raise ValueError("Batch response item count mismatch")
+            # Validate the whole chunk before extending so a mid-chunk
+            # failure cannot leave partial results behind for the fallback
+            # to duplicate.
+            validated = [_guard_result(item, schema) for item in items]
+            enriched.extend(validated)
+        except Exception:  # malformed batch; re-enrich one by one
+            fallback = [enrich_signal(signal, schema) for signal in chunk]
+            enriched.extend(fallback)
+    return enriched
+
+
+def enrich_signals_parallel(
+    signals: list[Dict[str, Any]], schema: Dict[str, Any], workers: Optional[int] = None
+) -> list[Dict[str, Any]]:
+    """Enrich signals concurrently with a bounded thread pool.
+
+    LLM calls are network-bound, so threads overlap the per-call round-trip
+    latency; ``workers`` caps in-flight requests to stay under provider rate
+    limits (defaults to the ENRICH_WORKERS env var, or 8). Results are
+    returned in input order.
+    """
+    if workers is None:
+        workers = int(os.getenv("ENRICH_WORKERS", "8"))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda signal: enrich_signal(signal, schema), signals))
+
+
+async def enrich_signals_async(
+    signals: list[Dict[str, Any]], schema: Dict[str, Any], concurrency: int = 8
+) -> list[Dict[str, Any]]:
+    """Enrich signals concurrently from async code.
+
+    Each synchronous transport call is offloaded to a worker thread via
+    ``asyncio.to_thread`` and gathered, so the event loop overlaps the
+    network round-trips; ``concurrency`` caps in-flight requests the same
+    way ``workers`` does for :func:`enrich_signals_parallel`.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(signal: Dict[str, Any]) -> Dict[str, Any]:
+        async with sem:
+            return await asyncio.to_thread(enrich_signal, signal, schema)
+
+    return list(await asyncio.gather(*(_one(signal) for signal in signals)))
 
 
 def write_enriched_report(obj: Dict[str, Any], out_path: str) -> str:
     os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    with open(out_path, "wb") as f:
+        f.write(data)
+    return out_path
+
+
+def write_enriched_ndjson(objs: Iterable[Dict[str, Any]], out_path: str) -> str:
+    """Write enriched cards as NDJSON, one object per line.
+
+    Streams each card as it is serialized, so batch runs never materialize
+    the whole feed in memory, and appenders can extend the file line-wise.
+    """
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    with open(out_path, "wb") as f:
+        for obj in objs:
+            if orjson is not None:
+                f.write(orjson.dumps(obj))
+            else:
+                f.write(json.dumps(obj, ensure_ascii=False).encode("utf-8"))
+            f.write(b"\n")
     return out_path
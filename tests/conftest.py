@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.pipeline import Pipeline
+
+from src.model import train
+
+_SAMPLE = {
+    "EMF": [1.0, 2.0, 1.5, 1.2, 1.8, 2.2, 0.9, 1.1],
+    "Income": [1000, 2000, 1500, 1200, 1800, 2200, 900, 1100],
+    "Urbanization": [0.3, 0.7, 0.5, 0.4, 0.6, 0.8, 0.2, 0.35],
+    "TFR": [1.8, 2.1, 1.9, 1.7, 2.0, 2.2, 1.6, 1.75],
+}
+
+_DTYPES = {
+    "EMF": np.float32,
+    "Income": np.int32,
+    "Urbanization": np.float32,
+    "TFR": np.float32,
+}
+
+# Built once at import with explicit dtypes so pandas never re-infers them;
+# fixtures hand out copies to keep the constant pristine.
+_SAMPLE_DF = pd.DataFrame(_SAMPLE).astype(_DTYPES)
+
+# Same rows as _SAMPLE, pre-rendered so the CSV fixture is a plain file write
+# instead of a pandas CSVFormatter pass.
+_CSV_TEXT = """EMF,Income,Urbanization,TFR
+1.0,1000,0.30,1.80
+2.0,2000,0.70,2.10
+1.5,1500,0.50,1.90
+1.2,1200,0.40,1.70
+1.8,1800,0.60,2.00
+2.2,2200,0.80,2.20
+0.9,900,0.20,1.60
+1.1,1100,0.35,1.75
+"""
+
+
+@pytest.fixture(scope="session")
+def sample_df() -> pd.DataFrame:
+    """The shared 8-row training frame, built in memory."""
+    return _SAMPLE_DF.copy()
+
+
+@pytest.fixture(scope="session")
+def sample_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the shared training CSV once per session, for tests that need a file."""
+    path = tmp_path_factory.mktemp("data") / "data.csv"
+    path.write_text(_CSV_TEXT, encoding="utf-8")
+    return path
+
+
+@pytest.fixture(scope="session")
+def trained(sample_df: pd.DataFrame) -> Tuple[pd.DataFrame, Pipeline, Dict[str, float]]:
+    """Train once on the in-memory frame; CSV parsing is covered separately."""
+    pipeline, metrics = train(sample_df)
+    return sample_df, pipeline, metrics
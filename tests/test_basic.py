@@ -1,41 +1,64 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Dict, Tuple
 
 import pandas as pd
+import pytest
+from sklearn.pipeline import Pipeline
 
 from src.data import load_data
-from src.model import train
 
 
-def test_load_data(tmp_path: Path) -> None:
-    csv_path = tmp_path / "data.csv"
-    pd.DataFrame(
-        {
-            "EMF": [1.0, 2.0],
-            "Income": [1000, 2000],
-            "Urbanization": [0.3, 0.7],
-            "TFR": [1.8, 2.1],
-        }
-    ).to_csv(csv_path, index=False)
+def test_load_data(sample_csv: Path) -> None:
+    dtype = {"EMF": "float32", "Income": "int32", "Urbanization": "float32", "TFR": "float32"}
+    df = load_data(str(sample_csv), dtype=dtype)
+    assert set(["EMF", "Income", "Urbanization", "TFR"]).issubset(df.columns)
+    assert df["EMF"].dtype == "float32" and df["Income"].dtype == "int32"
+
 
-    df = load_data(str(csv_path))
+def test_load_data_parquet(tmp_path: Path, sample_df: pd.DataFrame) -> None:
+    pytest.importorskip("pyarrow")
+    parquet_path = tmp_path / "data.parquet"
+    sample_df.to_parquet(parquet_path)
+    df = load_data(str(parquet_path))
     assert set(["EMF", "Income", "Urbanization", "TFR"]).issubset(df.columns)
 
 
-def test_train_predict(tmp_path: Path) -> None:
-    csv_path = tmp_path / "data.csv"
-    pd.DataFrame(
-        {
-            "EMF": [1.0, 2.0, 1.5, 1.2, 1.8, 2.2, 0.9, 1.1],
-            "Income": [1000, 2000, 1500, 1200, 1800, 2200, 900, 1100],
-            "Urbanization": [0.3, 0.7, 0.5, 0.4, 0.6, 0.8, 0.2, 0.35],
-            "TFR": [1.8, 2.1, 1.9, 1.7, 2.0, 2.2, 1.6, 1.75],
-        }
-    ).to_csv(csv_path, index=False)
+@pytest.mark.slow
+def test_train_predict(trained: Tuple[pd.DataFrame, Pipeline, Dict[str, float]]) -> None:
+    from src.model import _predict_inputs
 
-    df = load_data(str(csv_path))
-    pipeline, metrics = train(df)
+    df, pipeline, metrics = trained
     assert "rmse" in metrics and "r2" in metrics
-    preds = pipeline.predict(df[["EMF", "Income", "Urbanization"]])
+    preds = pipeline.predict(_predict_inputs(pipeline, df[["EMF", "Income", "Urbanization"]]))
+    assert preds.shape[0] == df.shape[0]
+
+
+@pytest.mark.slow
+def test_fast_predict_fallback(
+    trained: Tuple[pd.DataFrame, Pipeline, Dict[str, float]], tmp_path: Path
+) -> None:
+    """Without an ONNX artifact, fast_predict must defer to the pipeline."""
+    from src.model import fast_predict
+
+    df, pipeline, _ = trained
+    preds = fast_predict(
+        pipeline, df[["EMF", "Income", "Urbanization"]], onnx_path=str(tmp_path / "missing.onnx")
+    )
     assert preds.shape[0] == df.shape[0]
+
+
+def test_train_contract(sample_df: pd.DataFrame, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Exercise train()'s structure without the real estimator FLOPs."""
+    from sklearn.dummy import DummyRegressor
+
+    from src import model
+
+    monkeypatch.setattr(
+        model, "build_model", lambda **kwargs: Pipeline([("reg", DummyRegressor())])
+    )
+    pipeline, metrics = model.train(sample_df)
+    assert "rmse" in metrics and "r2" in metrics and metrics["mode"] == "holdout"
+    preds = pipeline.predict(sample_df[["EMF", "Income", "Urbanization"]])
+    assert preds.shape[0] == sample_df.shape[0]
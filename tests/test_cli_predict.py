@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import io
 import json
-import subprocess
+from contextlib import redirect_stdout
 from pathlib import Path
 
+import pytest
 
-def test_cli_train_and_predict(tmp_path: Path) -> None:
-    project_root = Path(__file__).resolve().parents[1]
-    venv_python = project_root / ".venv/bin/python"
-    assert venv_python.exists(), "Virtualenv not found; create it before running tests"
+from src.cli import main
+
+
+def test_cli_train_and_predict(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Run from a temp directory so ./artifacts lands there, not in the repo
+    monkeypatch.chdir(tmp_path)
 
     # Prepare minimal CSV in temp directory
     data_dir = tmp_path / "data"
@@ -28,32 +32,16 @@ def test_cli_train_and_predict(tmp_path: Path) -> None:
         encoding="utf-8",
     )
 
-    # Train (linear + small CV)
-    train_cmd = [
-        str(venv_python),
-        "-m",
-        "src.cli",
-        "train",
-        "--csv",
-        str(csv_path),
-        "--model",
-        "linear",
-        "--cv",
-        "4",
-    ]
-    proc_train = subprocess.run(train_cmd, cwd=project_root, capture_output=True, text=True)
-    assert proc_train.returncode == 0, proc_train.stderr
+    # Train (linear + small CV), in-process to skip interpreter startup
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        main(["train", "--csv", str(csv_path), "--model", "linear", "--cv", "2"])
+    train_out = json.loads(buf.getvalue())
+    assert "rmse" in train_out and "r2" in train_out
 
     # Predict
-    pred_cmd = [
-        str(venv_python),
-        "-m",
-        "src.cli",
-        "predict",
-        "--csv",
-        str(csv_path),
-    ]
-    proc_pred = subprocess.run(pred_cmd, cwd=project_root, capture_output=True, text=True)
-    assert proc_pred.returncode == 0, proc_pred.stderr
-    out = json.loads(proc_pred.stdout)
-    assert "predictions" in out and len(out["predictions"]) == 8
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        main(["predict", "--csv", str(csv_path)])
+    pred_out = json.loads(buf.getvalue())
+    assert "predictions" in pred_out and len(pred_out["predictions"]) == 8
@@ -1,30 +1,59 @@
+import functools
 import json
 import pathlib
 
 from jsonschema import Draft202012Validator
 
+try:  # optional: compiled validator, same preference as publisher_llm
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
-def test_feed_item_schema_loads_and_validates_minimal() -> None:
-    schema_path = pathlib.Path("artifacts/feed_item_schema.json")
-    schema = json.loads(schema_path.read_text())
+try:  # optional: C-implemented JSON parser
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=None)
+def _validator(schema_path: str):
+    """Compile the schema once per path (fastjsonschema callable or validator)."""
+    raw = pathlib.Path(schema_path).read_bytes()
+    schema = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    if fastjsonschema is not None:
+        return fastjsonschema.compile(schema)
     Draft202012Validator.check_schema(schema)
-    sample = {
-        "id": "sig-demo-1",
-        "title": "Demo title",
-        "lede": "Short lede sentence.",
+    return Draft202012Validator(schema)
+
+
+# Minimal valid card, built once at import and reused across repeated runs
+_SAMPLE = {
+    "id": "sig-demo-1",
+    "title": "Demo title",
+    "lede": "Short lede sentence.",
+    "category": "economy",
+    "sources": ["https://example.com/a"],
+    "symbolic_art": {
+        "style": "symbolist-minimal",
+        "palette": ["#0A2342", "#FF7A00", "#F2F4F7", "#1A1F2B"],
         "category": "economy",
-        "sources": ["https://example.com/a"],
-        "symbolic_art": {
-            "style": "symbolist-minimal",
-            "palette": ["#0A2342", "#FF7A00", "#F2F4F7", "#1A1F2B"],
-            "category": "economy",
-            "alt": "Symbolic chart",
-            "svg": (
-                "<svg viewBox='0 0 320 180' xmlns='http://www.w3.org/2000/svg'>"
-                "<rect width='320' height='180' fill='#0A2342'/></svg>"
-            ),
-        },
-        "cta": {"label": "Download report", "url": "/api/download?id=report"},
-        "published_at": "2025-01-01T00:00:00Z",
-    }
-    Draft202012Validator(schema).validate(sample)
+        "alt": "Symbolic chart",
+        "svg": (
+            "<svg viewBox='0 0 320 180' xmlns='http://www.w3.org/2000/svg'>"
+            "<rect width='320' height='180' fill='#0A2342'/></svg>"
+        ),
+    },
+    "cta": {"label": "Download report", "url": "/api/download/report"},
+    "published_at": "2025-01-01T00:00:00Z",
+}
+
+
+def test_feed_item_schema_loads_and_validates_minimal() -> None:
+    validator = _validator("artifacts/feed_item_schema.json")
+    sample = _SAMPLE
+    if hasattr(validator, "iter_errors"):
+        # Stop at the first error instead of building the full error tree
+        err = next(validator.iter_errors(sample), None)
+        assert err is None, err
+    else:
+        validator(sample)